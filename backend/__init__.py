@@ -1,14 +1,23 @@
 # backend/__init__.py
 # This file makes the backend directory a Python package
 
-from .audio_recorder import AudioRecorder
-from .config import Config
+import importlib
+
+# Imported eagerly: the instance shares its name with the submodule, which
+# the import system would otherwise bind here once any sibling imports it
 from .error_tracker import error_tracker
-from .feedback_engine import FeedbackEngine
-from .guest_research import GuestResearch
-from .logger import Logger
-from .soapboxx_core import SoapBoxxCore
-from .transcriber import Transcriber
+
+# Components are imported on first access so that importing one backend
+# module does not load every other one (audio devices, AI clients, models)
+_LAZY_IMPORTS = {
+    "SoapBoxxCore": "soapboxx_core",
+    "Config": "config",
+    "Transcriber": "transcriber",
+    "FeedbackEngine": "feedback_engine",
+    "GuestResearch": "guest_research",
+    "AudioRecorder": "audio_recorder",
+    "Logger": "logger",
+}
 
 __all__ = [
     "SoapBoxxCore",
@@ -20,3 +29,16 @@ __all__ = [
     "Logger",
     "error_tracker",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -108,26 +108,14 @@ class GuestResearch:
             return self._get_fallback_research(guest_name, website)
 
         try:
-            # Gather information about the guest using web search
-            web_results = self._search_web(guest_name, website)
-            guest_info = self._gather_guest_info(
-                guest_name, website, additional_info, web_results
-            )
-
-            # Generate research using AI
-            research_prompt = self._create_research_prompt(guest_name, guest_info)
+            # Gather information about the guest and build the AI prompt
+            research_prompt = self._build_prompt(guest_name, website, additional_info)
 
             # Call OpenAI API using appropriate method
             if self.use_new_api and self.client:
                 response = self.client.chat.completions.create(
                     model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert podcast researcher and interviewer.",
-                        },
-                        {"role": "user", "content": research_prompt},
-                    ],
+                    messages=self._build_research_messages(research_prompt),
                     max_tokens=800,
                     temperature=0.7,
                 )
@@ -137,13 +125,7 @@ class GuestResearch:
                 try:
                     response = openai.ChatCompletion.create(
                         model="gpt-3.5-turbo",
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are an expert podcast researcher and interviewer.",
-                            },
-                            {"role": "user", "content": research_prompt},
-                        ],
+                        messages=self._build_research_messages(research_prompt),
                         max_tokens=800,
                         temperature=0.7,
                     )
@@ -161,6 +143,114 @@ class GuestResearch:
             )
             return self._get_fallback_research(guest_name, website)
 
+    def research_batch(
+        self,
+        guest_names: List[str],
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+    ) -> Dict[str, Dict]:
+        """
+        Research several guests in a single OpenAI Batch API job
+
+        Args:
+            guest_names: Names of the guests to research
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before giving up
+
+        Returns:
+            Dictionary mapping each guest name to its research results
+        """
+        results = {}
+        names = []
+        for guest_name in guest_names:
+            if not guest_name or not guest_name.strip():
+                results[guest_name] = self.research(guest_name)
+            else:
+                names.append(guest_name)
+
+        if not names:
+            return results
+
+        # The Batch API needs the new client; otherwise research one by one
+        if not (self.use_new_api and self.client):
+            for guest_name in names:
+                results[guest_name] = self.research(guest_name)
+            return results
+
+        try:
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": f"guest-{index}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": "gpt-3.5-turbo",
+                            "messages": self._build_research_messages(
+                                self._build_prompt(guest_name)
+                            ),
+                            "max_tokens": 800,
+                            "temperature": 0.7,
+                        },
+                    }
+                )
+                for index, guest_name in enumerate(names)
+            ]
+
+            batch_file = self.client.files.create(
+                file=("guest_research_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            deadline = time.time() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.time() > deadline:
+                    self.client.batches.cancel(batch.id)
+                    raise TimeoutError(
+                        f"Batch {batch.id} still {batch.status} after {timeout}s"
+                    )
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                guest_name = names[int(entry["custom_id"].split("-", 1)[1])]
+                research_text = response["body"]["choices"][0]["message"][
+                    "content"
+                ].strip()
+                results[guest_name] = self._parse_research_response(
+                    research_text, guest_name
+                )
+
+        except Exception as e:
+            print(f"Batch guest research error: {e}")
+            track_api_error(
+                f"Batch guest research error: {e}",
+                component="guest_research",
+                exception=e,
+            )
+
+        # Guests missing from the batch output get the basic fallback
+        for guest_name in names:
+            if guest_name not in results:
+                results[guest_name] = self._get_fallback_research(guest_name)
+
+        return results
+
     def search_business(self, company_name: str, search_type: str = "company") -> Dict:
         """
         Search for business and company information including LinkedIn profiles
@@ -1246,6 +1336,26 @@ Information about {company_name}'s notable achievements or challenges is not cur
 
         return "\n".join(info_parts)
 
+    def _build_prompt(
+        self, guest_name: str, website: str = None, additional_info: str = None
+    ) -> str:
+        """Search the web for the guest and build the research prompt"""
+        web_results = self._search_web(guest_name, website)
+        guest_info = self._gather_guest_info(
+            guest_name, website, additional_info, web_results
+        )
+        return self._create_research_prompt(guest_name, guest_info)
+
+    def _build_research_messages(self, research_prompt: str) -> List[Dict]:
+        """Build the chat messages for a research prompt"""
+        return [
+            {
+                "role": "system",
+                "content": "You are an expert podcast researcher and interviewer.",
+            },
+            {"role": "user", "content": research_prompt},
+        ]
+
     def _create_research_prompt(self, guest_name: str, guest_info: str) -> str:
         """Create a detailed prompt for guest research"""
         return f"""
@@ -81,6 +81,16 @@ except ImportError:
     print("Warning: pydub not available. Install with: pip install pydub")
 
 
+def _clamp_speed(speed: float) -> float:
+    """Clamp speech speed to the supported 0.5-2.0 range"""
+    return 0.5 if speed < 0.5 else 2.0 if speed > 2.0 else speed
+
+
+def _clamp_volume(volume: float) -> float:
+    """Clamp volume level to the supported 0.0-1.0 range"""
+    return 0.0 if volume < 0.0 else 1.0 if volume > 1.0 else volume
+
+
 class TTSGenerator:
     """
     Comprehensive Text-to-Speech generator with multiple service support
@@ -164,7 +174,7 @@ class TTSGenerator:
             Path to generated audio file or None if failed
         """
         try:
-            if not text.strip():
+            if not text or text.isspace():
                 track_api_error(
                     "Empty text provided for TTS generation",
                     category=ErrorCategory.TTS,
@@ -173,8 +183,8 @@ class TTSGenerator:
                 return None
 
             # Validate parameters
-            speed = max(0.5, min(2.0, speed))
-            volume = max(0.0, min(1.0, volume))
+            speed = _clamp_speed(speed)
+            volume = _clamp_volume(volume)
 
             # Use default voice if none specified
             if not voice:
@@ -5,34 +5,245 @@ Tests the complete system workflow from start to finish
 """
 
 import concurrent.futures
+import importlib
+import io
 import json
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
 import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Try to import orjson for faster report serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add backend to path
 sys.path.append("backend")
 
-from backend.audio_recorder import AudioRecorder
-from backend.config import Config
-from backend.error_tracker import error_tracker
-from backend.feedback_engine import FeedbackEngine
-from backend.guest_research import GuestResearch
-from backend.logger import Logger
-from backend.soapboxx_core import SoapBoxxCore
-from backend.transcriber import Transcriber
+
+def _lazy(module_name, attr):
+    """Import a backend attribute on first use rather than at module import"""
+    return getattr(importlib.import_module(module_name), attr)
+
+
+# Error recovery inputs, built once per process. Payloads are non-zero so
+# they get past Transcriber's all-zero audio check.
+_ERROR_SCENARIOS = (
+    ("Invalid audio data", b"not_audio_data"),
+    ("Empty audio", b""),
+    ("Very large audio", b"dummy" * 2_000_000),  # ~8MB
+    ("None input", None),
+    ("Corrupted audio", b"RIFF\x00\x00\x00\x00WAVE"),
+    ("Unsupported format", b"UNSUPPORTED_FORMAT_DATA"),
+)
+
+# Dummy audio payloads for the concurrency and memory stress tests
+_TASK_AUDIO = b"dummy_audio_data" * 100
+_DUMMY_AUDIO = b"dummy_audio_data" * 50
+
+# Memory stress stops early once RSS growth over the last
+# _PLATEAU_WINDOW samples stays under _PLATEAU_SLOPE MB/iteration twice
+_PLATEAU_WINDOW = 10
+_PLATEAU_SLOPE = 0.05
+
+
+class _RSSSampler:
+    """Reads resident memory in MB, via /proc/self/statm where available"""
+
+    def __init__(self):
+        self._statm = None
+        self._process = None
+        try:
+            # Keep the file open; each sample is just seek + read
+            self._statm = open("/proc/self/statm", "rb")
+            self._page_size = os.sysconf("SC_PAGE_SIZE")
+        except (OSError, AttributeError, ValueError):
+            import psutil
+
+            self._process = psutil.Process()
+
+    def sample(self) -> float:
+        if self._statm is not None:
+            self._statm.seek(0)
+            return int(self._statm.read().split()[1]) * self._page_size / 1024 / 1024
+        return self._process.memory_info().rss / 1024 / 1024
+
+    def close(self):
+        if self._statm is not None:
+            self._statm.close()
+            self._statm = None
+
+
+class _ThreadLocalStdout:
+    """sys.stdout proxy that sends each thread's writes to its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        """Route this thread's output into buffer, or straight through if None"""
+        self._local.buffer = buffer
+
+    def current(self):
+        return getattr(self._local, "buffer", None)
+
+    def write(self, text):
+        buffer = self.current()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _thread_pool(max_workers):
+    """ThreadPoolExecutor whose workers print into the caller's output buffer"""
+    stdout = sys.stdout
+    if isinstance(stdout, _ThreadLocalStdout):
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=stdout.capture,
+            initargs=(stdout.current(),),
+        )
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+
+def _summarize_bool(result):
+    """Summarize a pass/fail test result as (total, ok, failed, status)"""
+    return 1, int(result), int(not result), "✅ PASS" if result else "❌ FAIL"
+
+
+def _summarize_list(result):
+    """Summarize a list of per-operation results"""
+    successful = sum(1 for r in result if r.get("success", False))
+    failed = sum(1 for r in result if not r.get("success", True))
+    total = len(result)
+    marker = "✅" if successful == total else "⚠️"
+    return total, successful, failed, f"{marker} {successful}/{total}"
+
+
+def _summarize_dict(result):
+    """Summarize a single dict result; errored tests count no operations"""
+    if "error" in result:
+        return 0, 0, 0, "❌ ERROR"
+    if result.get("success", False):
+        return 1, 1, 0, "✅ PASS"
+    return 1, 0, 1, "⚠️ PARTIAL"
+
+
+_RESULT_HANDLERS = {
+    bool: _summarize_bool,
+    list: _summarize_list,
+    dict: _summarize_dict,
+}
+
+
+def _run_under_perf(callable_path):
+    """Run a module-level callable in a child process under ``perf stat``
+
+    Returns hardware counter totals keyed by event name.
+    """
+    if not shutil.which("perf"):
+        return {"error": "perf not available"}
+
+    events = "cache-misses,instructions,cycles"
+    env = dict(os.environ)
+    env.pop("E2E_USE_PERF", None)  # the child must not recurse
+    completed = subprocess.run(
+        [
+            "perf",
+            "stat",
+            "-x",
+            ",",
+            "-e",
+            events,
+            sys.executable,
+            "-c",
+            f"from e2e_stress_test import {callable_path}; {callable_path}()",
+        ],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    # perf -x , emits "value,unit,event,..." per counter on stderr
+    metrics = {}
+    for line in completed.stderr.splitlines():
+        fields = line.split(",")
+        if len(fields) < 3 or fields[2] not in events.split(","):
+            continue
+        try:
+            metrics[fields[2]] = int(fields[0])
+        except ValueError:
+            metrics[fields[2]] = None  # <not supported> / <not counted>
+
+    if metrics.get("instructions") and metrics.get("cycles"):
+        metrics["ipc"] = metrics["instructions"] / metrics["cycles"]
+    return metrics
+
+
+def _run_memory_stress():
+    """Entry point for running the memory stress test in a child process"""
+    os.environ["SOAPBOXX_TEST_MODE"] = "1"
+    E2EStressTester().test_memory_stress_over_time()
+
+
+# Shared component instances. Tests that need fresh state must call
+# ``<factory>.cache_clear()`` before using the factory again.
+@lru_cache(maxsize=1)
+def _transcriber():
+    return _lazy("backend.transcriber", "Transcriber")()
+
+
+@lru_cache(maxsize=1)
+def _feedback_engine():
+    return _lazy("backend.feedback_engine", "FeedbackEngine")()
+
+
+@lru_cache(maxsize=1)
+def _research():
+    return _lazy("backend.guest_research", "GuestResearch")()
+
+
+@lru_cache(maxsize=1)
+def _core():
+    return _lazy("backend.soapboxx_core", "SoapBoxxCore")()
+
+
+# Research results keyed by guest name, shared across tests so repeated
+# queries do not hit the APIs again
+_research_cache = {}
+
+
+def _cached_research(guest_name):
+    if guest_name not in _research_cache:
+        _research_cache[guest_name] = _research().research(guest_name)
+    return _research_cache[guest_name]
 
 
 class E2EStressTester:
     def __init__(self):
         self.results = {}
-        self.config = Config()
-        self.logger = Logger()
+        self.config = _lazy("backend.config", "Config")()
+        self.logger = _lazy("backend.logger", "Logger")()
         self.start_time = None
         self.end_time = None
 
@@ -42,7 +253,7 @@ class E2EStressTester:
 
         try:
             # Test config loading
-            config = Config()
+            config = _lazy("backend.config", "Config")()
             assert config is not None, "Config should load"
 
             # Test OpenAI API
@@ -51,12 +262,13 @@ class E2EStressTester:
 
             # Test all core components
             components = {
-                "AudioRecorder": AudioRecorder(),
-                "Transcriber": Transcriber(),
-                "FeedbackEngine": FeedbackEngine(),
-                "GuestResearch": GuestResearch(),
-                "Logger": Logger(),
-                "SoapBoxxCore": SoapBoxxCore(),
+                "AudioRecorder": _lazy("backend.audio_recorder", "AudioRecorder")(),
+                "Transcriber": _transcriber(),
+                "FeedbackEngine": _feedback_engine(),
+                "GuestResearch": _research(),
+                "Logger": _lazy("backend.logger", "Logger")(),
+                # Constructed fresh so the initialization path is exercised
+                "SoapBoxxCore": _lazy("backend.soapboxx_core", "SoapBoxxCore")(),
             }
 
             for name, component in components.items():
@@ -78,14 +290,14 @@ class E2EStressTester:
 
         try:
             # Step 1: Initialize components
-            recorder = AudioRecorder()
-            transcriber = Transcriber()
-            feedback_engine = FeedbackEngine()
-            core = SoapBoxxCore()
+            recorder = _lazy("backend.audio_recorder", "AudioRecorder")()
+            transcriber = _transcriber()
+            feedback_engine = _feedback_engine()
+            core = _core()
 
             # Step 2: Start recording
             print("   Step 1: Starting recording...")
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
 
             recording_success = recorder.start_recording()
             if not recording_success:
@@ -99,17 +311,17 @@ class E2EStressTester:
             print("   Step 2: Stopping recording...")
             audio_data = recorder.stop_recording()
 
-            recording_time = time.time() - start_time
+            recording_time = (time.perf_counter_ns() - start_time) / 1e9
             print(
                 f"   ✅ Recording completed in {recording_time:.2f}s ({len(audio_data)} bytes)"
             )
 
             # Step 4: Transcribe audio
             print("   Step 3: Transcribing audio...")
-            transcription_start = time.time()
+            transcription_start = time.perf_counter_ns()
 
             transcript = transcriber.transcribe(audio_data)
-            transcription_time = time.time() - transcription_start
+            transcription_time = (time.perf_counter_ns() - transcription_start) / 1e9
 
             if transcript.startswith("Error:"):
                 print(f"   ⚠️ Transcription failed: {transcript}")
@@ -124,15 +336,15 @@ class E2EStressTester:
 
             # Step 5: Generate feedback
             print("   Step 4: Generating feedback...")
-            feedback_start = time.time()
+            feedback_start = time.perf_counter_ns()
 
             feedback = feedback_engine.analyze(transcript)
-            feedback_time = time.time() - feedback_start
+            feedback_time = (time.perf_counter_ns() - feedback_start) / 1e9
 
             print(f"   ✅ Feedback generated in {feedback_time:.2f}s")
 
             # Step 6: Complete workflow
-            workflow_time = time.time() - start_time
+            workflow_time = (time.perf_counter_ns() - start_time) / 1e9
 
             workflow_results.append(
                 {
@@ -161,7 +373,7 @@ class E2EStressTester:
         research_results = []
 
         try:
-            research = GuestResearch()
+            research = _research()
 
             # Test different guest types
             test_guests = [
@@ -172,38 +384,52 @@ class E2EStressTester:
                 "Thought Leader",
             ]
 
+            def summarize(guest, result, research_time):
+                return {
+                    "guest": guest,
+                    "research_time": research_time,
+                    "success": "error" not in result,
+                    "has_profile": "profile" in result and result["profile"],
+                    "has_talking_points": (
+                        "talking_points" in result and result["talking_points"]
+                    ),
+                    "has_questions": "questions" in result and result["questions"],
+                    "fallback_used": result.get("fallback", False),
+                }
+
+            # Submit every guest as one OpenAI batch job when requested
+            if os.getenv("E2E_USE_BATCH") == "1":
+                print(f"   Researching {len(test_guests)} guests in one batch...")
+                start_time = time.perf_counter_ns()
+                batch_results = research.research_batch(test_guests)
+                # Each entry records the wall time of the whole batch
+                research_time = (time.perf_counter_ns() - start_time) / 1e9
+
+                for guest in test_guests:
+                    entry = summarize(guest, batch_results[guest], research_time)
+                    entry["batch_mode"] = True
+                    research_results.append(entry)
+
+                print(f"     ✅ Batch completed in {research_time:.2f}s")
+                return research_results
+
+            # Bypass _cached_research here: this test measures cold latency
             for guest in test_guests:
                 print(f"   Researching: {guest}")
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
 
                 try:
                     result = research.research(guest)
-                    research_time = time.time() - start_time
-
-                    success = "error" not in result
-                    has_profile = "profile" in result and result["profile"]
-                    has_talking_points = (
-                        "talking_points" in result and result["talking_points"]
-                    )
-                    has_questions = "questions" in result and result["questions"]
+                    research_time = (time.perf_counter_ns() - start_time) / 1e9
 
-                    research_results.append(
-                        {
-                            "guest": guest,
-                            "research_time": research_time,
-                            "success": success,
-                            "has_profile": has_profile,
-                            "has_talking_points": has_talking_points,
-                            "has_questions": has_questions,
-                            "fallback_used": result.get("fallback", False),
-                        }
-                    )
+                    entry = summarize(guest, result, research_time)
+                    research_results.append(entry)
 
-                    status = "✅" if success else "⚠️"
+                    status = "✅" if entry["success"] else "⚠️"
                     print(f"     {status} {guest}: {research_time:.2f}s")
 
                 except Exception as e:
-                    research_time = time.time() - start_time
+                    research_time = (time.perf_counter_ns() - start_time) / 1e9
                     research_results.append(
                         {
                             "guest": guest,
@@ -226,15 +452,29 @@ class E2EStressTester:
 
         concurrent_results = []
 
+        if os.getenv("E2E_LIVE") == "1":
+            # Share one client per component across tasks; the API clients are
+            # thread-safe and reuse pooled connections instead of a fresh
+            # client (and TLS handshake) per task
+            transcribe = _transcriber().transcribe
+            analyze = _feedback_engine().analyze
+            research = _cached_research
+        else:
+            # Stub the backends so this measures task scheduling rather than
+            # API round trips. The stubs stay local instead of patching the
+            # classes because other suites run alongside this one.
+            transcribe = mock.Mock(return_value="stub transcript")
+            analyze = mock.Mock(return_value={"listener_feedback": "ok"})
+            research = mock.Mock(return_value={"profile": "stub profile"})
+
         def run_transcription_task(task_id):
             """Run a transcription task"""
             try:
-                transcriber = Transcriber()
-                dummy_audio = b"dummy_audio_data" * 100
+                dummy_audio = _TASK_AUDIO
 
-                start_time = time.time()
-                result = transcriber.transcribe(dummy_audio)
-                duration = time.time() - start_time
+                start_time = time.perf_counter_ns()
+                result = transcribe(dummy_audio)
+                duration = (time.perf_counter_ns() - start_time) / 1e9
 
                 return {
                     "task_id": task_id,
@@ -254,14 +494,13 @@ class E2EStressTester:
         def run_feedback_task(task_id):
             """Run a feedback analysis task"""
             try:
-                engine = FeedbackEngine()
                 dummy_transcript = (
                     "This is a test transcript for concurrent stress testing. " * 10
                 )
 
-                start_time = time.time()
-                result = engine.analyze(dummy_transcript)
-                duration = time.time() - start_time
+                start_time = time.perf_counter_ns()
+                result = analyze(dummy_transcript)
+                duration = (time.perf_counter_ns() - start_time) / 1e9
 
                 return {
                     "task_id": task_id,
@@ -281,12 +520,11 @@ class E2EStressTester:
         def run_research_task(task_id):
             """Run a guest research task"""
             try:
-                research = GuestResearch()
                 guest_name = f"Test Guest {task_id}"
 
-                start_time = time.time()
-                result = research.research(guest_name)
-                duration = time.time() - start_time
+                start_time = time.perf_counter_ns()
+                result = research(guest_name)
+                duration = (time.perf_counter_ns() - start_time) / 1e9
 
                 return {
                     "task_id": task_id,
@@ -303,35 +541,24 @@ class E2EStressTester:
                     "error": str(e),
                 }
 
+        # Mixed workload: task i runs task_runners[i % 3]
+        task_runners = (run_transcription_task, run_feedback_task, run_research_task)
+
+        def run_task(task_id):
+            return task_runners[task_id % 3](task_id)
+
         # Test different concurrency levels
         concurrency_levels = [3, 5, 10]
 
         for concurrency in concurrency_levels:
             print(f"   Testing {concurrency} concurrent operations...")
 
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
 
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=concurrency
-            ) as executor:
-                # Submit mixed tasks
-                futures = []
-
-                for i in range(concurrency):
-                    if i % 3 == 0:
-                        futures.append(executor.submit(run_transcription_task, i))
-                    elif i % 3 == 1:
-                        futures.append(executor.submit(run_feedback_task, i))
-                    else:
-                        futures.append(executor.submit(run_research_task, i))
-
-                # Collect results
-                results = [
-                    future.result()
-                    for future in concurrent.futures.as_completed(futures)
-                ]
+            with _thread_pool(concurrency) as executor:
+                results = list(executor.map(run_task, range(concurrency)))
 
-            total_time = time.time() - start_time
+            total_time = (time.perf_counter_ns() - start_time) / 1e9
             successful = sum(1 for r in results if r["success"])
             failed = len(results) - successful
 
@@ -360,68 +587,108 @@ class E2EStressTester:
         try:
             import gc
 
-            import psutil
-
-            process = psutil.Process()
-            initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+            sampler = _RSSSampler()
+            initial_memory = sampler.sample()  # MB
 
             print(f"   Initial memory: {initial_memory:.2f} MB")
 
             memory_samples = []
 
+            # Build components once; steady-state calls are what we measure
+            transcriber = _transcriber()
+            feedback_engine = _feedback_engine()
+            research = _research()
+
+            flat_windows = 0
+            converged_at = None
+
             # Run extended operations
             for iteration in range(100):  # 100 iterations
-                iteration_start = time.time()
+                iteration_start = time.perf_counter_ns()
 
                 try:
-                    # Create fresh instances each time
-                    transcriber = Transcriber()
-                    feedback_engine = FeedbackEngine()
-                    research = GuestResearch()
+                    # Periodically rebuild so constructor paths are still covered
+                    if iteration and iteration % 25 == 0:
+                        for factory in (_transcriber, _feedback_engine, _research):
+                            factory.cache_clear()
+                        transcriber = _transcriber()
+                        feedback_engine = _feedback_engine()
+                        research = _research()
 
                     # Perform operations
-                    dummy_audio = b"dummy_audio_data" * 50
-                    transcript = transcriber.transcribe(dummy_audio)
+                    transcript = transcriber.transcribe(_DUMMY_AUDIO)
 
                     feedback_engine.analyze(
                         "Test transcript for memory stress testing."
                     )
+                    # Bypass _cached_research: leak detection needs every
+                    # iteration to run a real research call
                     research.research("Test Guest")
 
-                    # Force garbage collection
-                    gc.collect()
-
-                    current_memory = process.memory_info().rss / 1024 / 1024
-                    iteration_time = time.time() - iteration_start
-
-                    memory_samples.append(
-                        {
-                            "iteration": iteration,
-                            "memory_mb": current_memory,
-                            "memory_increase": current_memory - initial_memory,
-                            "duration": iteration_time,
-                        }
-                    )
-
-                    if iteration % 20 == 0:
-                        print(
-                            f"     Iteration {iteration}: {current_memory:.2f} MB (+{current_memory - initial_memory:.2f} MB)"
+                    # Force garbage collection every 10 iterations
+                    if iteration % 10 == 0:
+                        gc.collect()
+
+                    # Sample memory every 5th iteration
+                    if iteration % 5 == 0:
+                        current_memory = sampler.sample()
+                        iteration_time = (
+                            time.perf_counter_ns() - iteration_start
+                        ) / 1e9
+
+                        memory_samples.append(
+                            {
+                                "iteration": iteration,
+                                "memory_mb": current_memory,
+                                "memory_increase": current_memory - initial_memory,
+                                "duration": iteration_time,
+                            }
                         )
 
+                        if iteration % 20 == 0:
+                            print(
+                                f"     Iteration {iteration}: {current_memory:.2f} MB (+{current_memory - initial_memory:.2f} MB)"
+                            )
+
+                        # Stop once memory has plateaued for two windows
+                        if len(memory_samples) >= _PLATEAU_WINDOW:
+                            window = memory_samples[-_PLATEAU_WINDOW:]
+                            slope = np.polyfit(
+                                [m["iteration"] for m in window],
+                                [m["memory_mb"] for m in window],
+                                1,
+                            )[0]
+                            flat_windows = (
+                                flat_windows + 1 if abs(slope) < _PLATEAU_SLOPE else 0
+                            )
+                            if flat_windows >= 2:
+                                converged_at = iteration
+                                print(f"     Converged at iteration {iteration}")
+                                break
+
                 except Exception as e:
                     print(f"     ❌ Iteration {iteration} failed: {e}")
 
-            final_memory = process.memory_info().rss / 1024 / 1024
+            final_memory = sampler.sample()
+            sampler.close()
             print(f"   Final memory: {final_memory:.2f} MB")
             print(f"   Total memory increase: {final_memory - initial_memory:.2f} MB")
 
-            return {
+            result = {
                 "initial_memory": initial_memory,
                 "final_memory": final_memory,
                 "total_increase": final_memory - initial_memory,
+                "converged_at": converged_at,
                 "samples": memory_samples,
             }
 
+            # Optionally repeat the run under perf for hardware counters
+            if os.getenv("E2E_USE_PERF") == "1":
+                print("   Re-running under perf stat...")
+                result["perf"] = _run_under_perf("_run_memory_stress")
+
+            return result
+
         except ImportError:
             print("   ⚠️ psutil not available, skipping memory monitoring")
             return {"note": "Memory monitoring not available"}
@@ -433,71 +700,54 @@ class E2EStressTester:
         """Test various error recovery scenarios"""
         print("🛡️ Testing Error Recovery Scenarios...")
 
-        recovery_results = []
-
-        # Test scenarios
-        scenarios = [
-            ("Invalid audio data", b"not_audio_data"),
-            ("Empty audio", b""),
-            ("Very large audio", b"dummy" * 2000000),  # ~8MB
-            ("None input", None),
-            ("Corrupted audio", b"RIFF\x00\x00\x00\x00WAVE"),
-            ("Unsupported format", b"UNSUPPORTED_FORMAT_DATA"),
-        ]
-
-        for scenario_name, test_data in scenarios:
-            print(f"   Testing: {scenario_name}")
+        transcriber = _transcriber()
+        feedback_engine = _feedback_engine()
 
+        def run_scenario(scenario):
+            scenario_name, test_data = scenario
             try:
-                transcriber = Transcriber()
-                feedback_engine = FeedbackEngine()
-                research = GuestResearch()
+                start_time = time.perf_counter_ns()
 
-                start_time = time.time()
-
-                # Test transcription
-                if test_data is not None:
-                    transcript_result = transcriber.transcribe(test_data)
-                    transcription_handled = transcript_result.startswith("Error:")
-                else:
-                    transcript_result = transcriber.transcribe(None)
-                    transcription_handled = transcript_result.startswith("Error:")
+                # Test transcription (None input included)
+                transcript_result = transcriber.transcribe(test_data)
+                transcription_handled = transcript_result.startswith("Error:")
 
                 # Test feedback with invalid transcript
                 feedback_result = feedback_engine.analyze("")
                 feedback_handled = "listener_feedback" in feedback_result
 
                 # Test research with empty guest
-                research_result = research.research("")
+                research_result = _cached_research("")
                 research_handled = "error" in research_result
 
-                duration = time.time() - start_time
-
-                recovery_results.append(
-                    {
-                        "scenario": scenario_name,
-                        "transcription_handled": transcription_handled,
-                        "feedback_handled": feedback_handled,
-                        "research_handled": research_handled,
-                        "duration": duration,
-                        "success": transcription_handled
-                        and feedback_handled
-                        and research_handled,
-                    }
-                )
+                duration = (time.perf_counter_ns() - start_time) / 1e9
 
-                status = (
-                    "✅"
-                    if transcription_handled and feedback_handled and research_handled
-                    else "⚠️"
-                )
-                print(f"     {status} {scenario_name}: {duration:.3f}s")
+                return {
+                    "scenario": scenario_name,
+                    "transcription_handled": transcription_handled,
+                    "feedback_handled": feedback_handled,
+                    "research_handled": research_handled,
+                    "duration": duration,
+                    "success": transcription_handled
+                    and feedback_handled
+                    and research_handled,
+                }
 
             except Exception as e:
-                recovery_results.append(
-                    {"scenario": scenario_name, "error": str(e), "success": False}
-                )
-                print(f"     ❌ {scenario_name}: Crashed - {e}")
+                return {"scenario": scenario_name, "error": str(e), "success": False}
+
+        # Scenarios are independent, so their API round trips can overlap
+        with _thread_pool(len(_ERROR_SCENARIOS)) as executor:
+            recovery_results = list(executor.map(run_scenario, _ERROR_SCENARIOS))
+
+        for result in recovery_results:
+            scenario_name = result["scenario"]
+            print(f"   Testing: {scenario_name}")
+            if "error" in result:
+                print(f"     ❌ {scenario_name}: Crashed - {result['error']}")
+            else:
+                status = "✅" if result["success"] else "⚠️"
+                print(f"     {status} {scenario_name}: {result['duration']:.3f}s")
 
         return recovery_results
 
@@ -505,9 +755,10 @@ class E2EStressTester:
         """Test complete system integration"""
         print("🔗 Testing System Integration...")
 
+        core = None
         try:
-            # Initialize core system
-            core = SoapBoxxCore()
+            # Use the shared core system
+            core = _core()
 
             # Test status
             status = core.get_status()
@@ -543,6 +794,11 @@ class E2EStressTester:
             print(f"❌ System integration test failed: {e}")
             return False
 
+        finally:
+            # Clear the test callbacks so they do not leak into later tests
+            if core is not None:
+                core.set_callbacks()
+
     def run_complete_e2e_test(self):
         """Run complete end-to-end stress test"""
         print("🚀 Starting SoapBoxx End-to-End Stress Test")
@@ -550,28 +806,78 @@ class E2EStressTester:
 
         self.start_time = time.time()
 
-        # Run all E2E tests
-        tests = [
+        # Tests that record audio or sample process memory run on their own
+        serial_tests = [
             ("System Initialization", self.test_system_initialization),
             ("Complete Recording Workflow", self.test_complete_recording_workflow),
+            ("Memory Stress Over Time", self.test_memory_stress_over_time),
+        ]
+        # Independent, I/O-bound suites overlap their API round trips
+        parallel_tests = [
             ("Guest Research Workflow", self.test_guest_research_workflow),
             ("Concurrent Operations", self.test_concurrent_operations),
-            ("Memory Stress Over Time", self.test_memory_stress_over_time),
             ("Error Recovery Scenarios", self.test_error_recovery_scenarios),
             ("System Integration", self.test_system_integration),
         ]
+        test_order = [
+            "System Initialization",
+            "Complete Recording Workflow",
+            "Guest Research Workflow",
+            "Concurrent Operations",
+            "Memory Stress Over Time",
+            "Error Recovery Scenarios",
+            "System Integration",
+        ]
+
+        results = {}
+        print_lock = threading.Lock()
 
-        for test_name, test_func in tests:
+        def run_test(test_name, test_func):
             print(f"\n🔬 {test_name}")
             print("-" * 50)
 
             try:
                 result = test_func()
-                self.results[test_name] = result
                 print(f"✅ {test_name} completed")
             except Exception as e:
                 print(f"❌ {test_name} failed: {e}")
-                self.results[test_name] = {"error": str(e)}
+                result = {"error": str(e)}
+
+            results[test_name] = result
+
+        def run_buffered(stdout, test_name, test_func):
+            # Buffer the whole test, then print it in one piece
+            buffer = io.StringIO()
+            stdout.capture(buffer)
+            try:
+                run_test(test_name, test_func)
+            finally:
+                stdout.capture(None)
+                with print_lock:
+                    stdout.write(buffer.getvalue())
+
+        for test_name, test_func in serial_tests:
+            run_test(test_name, test_func)
+
+        original_stdout = sys.stdout
+        stdout = _ThreadLocalStdout(original_stdout)
+        sys.stdout = stdout
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(parallel_tests)
+            ) as executor:
+                futures = [
+                    executor.submit(run_buffered, stdout, test_name, test_func)
+                    for test_name, test_func in parallel_tests
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+        finally:
+            sys.stdout = original_stdout
+
+        # Keep the report in the canonical test order
+        for test_name in test_order:
+            self.results[test_name] = results[test_name]
 
         self.end_time = time.time()
 
@@ -580,6 +886,38 @@ class E2EStressTester:
 
         return self.results
 
+    def _collect_durations(self):
+        """Gather per-operation durations for each test, keyed by test name"""
+        durations = {}
+        for test_name, result in self.results.items():
+            # Stubbed concurrency tasks only measure scheduling overhead
+            if test_name == "Concurrent Operations" and os.getenv("E2E_LIVE") != "1":
+                continue
+
+            if isinstance(result, dict):
+                entries = result.get("samples", [])
+            elif isinstance(result, list):
+                entries = result
+            else:
+                continue
+
+            values = []
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                # Concurrency levels nest their per-task results
+                nested = entry.get("results")
+                for item in nested if isinstance(nested, list) else (entry,):
+                    for key in ("duration", "research_time"):
+                        if key in item:
+                            values.append(item[key])
+                            break
+
+            if values:
+                durations[test_name] = np.asarray(values, dtype=float)
+
+        return durations
+
     def _generate_e2e_report(self):
         """Generate comprehensive E2E test report"""
         total_time = self.end_time - self.start_time
@@ -593,32 +931,21 @@ class E2EStressTester:
         )
         print(f"Tests Completed: {len(self.results)}")
 
-        # Calculate overall metrics
+        # Calculate overall metrics and per-test status in one pass
         total_operations = 0
         successful_operations = 0
         failed_operations = 0
+        statuses = []
 
         for test_name, result in self.results.items():
-            if isinstance(result, bool):
-                if result:
-                    successful_operations += 1
-                else:
-                    failed_operations += 1
-                total_operations += 1
-            elif isinstance(result, list):
-                total_operations += len(result)
-                successful_operations += sum(
-                    1 for r in result if r.get("success", False)
-                )
-                failed_operations += sum(
-                    1 for r in result if not r.get("success", True)
-                )
-            elif isinstance(result, dict) and "error" not in result:
-                if result.get("success", False):
-                    successful_operations += 1
-                else:
-                    failed_operations += 1
-                total_operations += 1
+            handler = _RESULT_HANDLERS.get(type(result))
+            if handler is None:
+                continue
+            total, ok, fail, status = handler(result)
+            total_operations += total
+            successful_operations += ok
+            failed_operations += fail
+            statuses.append((test_name, status))
 
         success_rate = (
             (successful_operations / total_operations * 100)
@@ -631,27 +958,29 @@ class E2EStressTester:
         print(f"Failed: {failed_operations}")
         print(f"Success Rate: {success_rate:.1f}%")
 
+        # Latency summary per test; suites time different operations, so
+        # their durations are never pooled
+        latency = {}
+        for test_name, durations in self._collect_durations().items():
+            p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+            latency[test_name] = {
+                "count": int(durations.size),
+                "min": float(durations.min()),
+                "mean": float(durations.mean()),
+                "max": float(durations.max()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+            print(
+                f"Latency ({test_name}): p50 {p50:.3f}s, p95 {p95:.3f}s, "
+                f"p99 {p99:.3f}s ({durations.size} timed operations)"
+            )
+
         # Detailed results
         print(f"\n📋 Detailed Results:")
-        for test_name, result in self.results.items():
-            if isinstance(result, bool):
-                status = "✅ PASS" if result else "❌ FAIL"
-                print(f"   {test_name:<30} {status}")
-            elif isinstance(result, list):
-                successful = sum(1 for r in result if r.get("success", False))
-                total = len(result)
-                status = (
-                    f"✅ {successful}/{total}"
-                    if successful == total
-                    else f"⚠️ {successful}/{total}"
-                )
-                print(f"   {test_name:<30} {status}")
-            elif isinstance(result, dict):
-                if "error" in result:
-                    print(f"   {test_name:<30} ❌ ERROR")
-                else:
-                    status = "✅ PASS" if result.get("success", False) else "⚠️ PARTIAL"
-                    print(f"   {test_name:<30} {status}")
+        for test_name, status in statuses:
+            print(f"   {test_name:<30} {status}")
 
         # Save detailed report
         report = {
@@ -661,11 +990,20 @@ class E2EStressTester:
             "successful_operations": successful_operations,
             "failed_operations": failed_operations,
             "success_rate": success_rate,
+            "latency": latency,
             "results": self.results,
         }
 
-        with open("e2e_stress_test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+        # Encode up front so the report lands in one write() call
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(
+                report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            payload = json.dumps(report, indent=2).encode("utf-8")
+
+        with open("e2e_stress_test_report.json", "wb") as f:
+            f.write(payload)
 
         print(f"\n📄 Detailed report saved to: e2e_stress_test_report.json")
 
@@ -1,9 +1,28 @@
 # frontend/__init__.py
 # This file makes the frontend directory a Python package
 
-from .main_window import MainWindow
-from .reverb_tab import ReverbTab
-from .scoop_tab import ScoopTab
-from .soapboxx_tab import SoapBoxxTab
+import importlib
+
+# Qt widgets are imported on first access so that `import frontend`
+# does not pull in PyQt for code paths that never render UI
+_LAZY_IMPORTS = {
+    "MainWindow": "main_window",
+    "SoapBoxxTab": "soapboxx_tab",
+    "ReverbTab": "reverb_tab",
+    "ScoopTab": "scoop_tab",
+}
 
 __all__ = ["MainWindow", "SoapBoxxTab", "ReverbTab", "ScoopTab"]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,8 @@ Handles exporting transcripts, feedback, and analytics to various formats
 """
 
 import csv
+import gzip
+import io
 import json
 import os
 from datetime import datetime
@@ -14,6 +16,61 @@ from typing import Any, Dict, List, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
+# Try to import orjson for faster JSON exports
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import msgpack for compact binary session reports
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+# Session reports larger than this are written as compact, gzipped JSON
+_GZIP_THRESHOLD = 64 * 1024
+
+
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize export data to UTF-8 JSON, indented unless told otherwise"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _flatten(data: Dict, timestamp: str, prefix: str = ""):
+    """Yield (metric, value, timestamp) rows, joining nested keys with '_'"""
+    for key, value in data.items():
+        metric = f"{prefix}_{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten(value, timestamp, metric)
+        else:
+            yield (metric, value, timestamp)
+
+
+def _write_file_bytes(path: str, payload: bytes):
+    """Write an encoded payload straight to a file descriptor (POSIX only)"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
 class ExportManager(QObject):
     """Manages export functionality for SoapBoxx"""
@@ -21,27 +78,32 @@ class ExportManager(QObject):
     export_completed = pyqtSignal(str, str)  # filename, format
     export_failed = pyqtSignal(str)  # error message
 
+    # Export directories already created by this process
+    _ensured_dirs = set()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.export_dir = Path.home() / "SoapBoxx" / "Exports"
-        self.export_dir.mkdir(parents=True, exist_ok=True)
+        if self.export_dir not in ExportManager._ensured_dirs:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            ExportManager._ensured_dirs.add(self.export_dir)
+        # Export filenames are built by plain string concatenation
+        self._dir_str = str(self.export_dir) + os.sep
 
     def export_transcript(self, transcript: str, session_name: str = None) -> bool:
         """Export transcript to text file"""
         try:
+            now = datetime.now()
             if not session_name:
-                session_name = f"transcript_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                session_name = f"transcript_{now.strftime('%Y%m%d_%H%M%S')}"
 
-            filename = self.export_dir / f"{session_name}_transcript.txt"
+            filename = self._dir_str + session_name + "_transcript.txt"
 
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(f"SOAPBOXX TRANSCRIPT\n")
-                f.write(f"Session: {session_name}\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'='*50}\n\n")
-                f.write(transcript)
+            self._write_transcript(
+                filename, self._format_transcript(transcript, session_name, now)
+            )
 
-            self.export_completed.emit(str(filename), "text")
+            self.export_completed.emit(filename, "text")
             return True
 
         except Exception as e:
@@ -51,21 +113,17 @@ class ExportManager(QObject):
     def export_feedback(self, feedback: Dict, session_name: str = None) -> bool:
         """Export feedback to JSON file"""
         try:
+            now = datetime.now()
             if not session_name:
-                session_name = f"feedback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-            filename = self.export_dir / f"{session_name}_feedback.json"
+                session_name = f"feedback_{now.strftime('%Y%m%d_%H%M%S')}"
 
-            export_data = {
-                "session_name": session_name,
-                "export_date": datetime.now().isoformat(),
-                "feedback": feedback,
-            }
+            filename = self._dir_str + session_name + "_feedback.json"
 
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            self._write_bytes(
+                filename, _dump_json(self._feedback_data(feedback, session_name, now))
+            )
 
-            self.export_completed.emit(str(filename), "json")
+            self.export_completed.emit(filename, "json")
             return True
 
         except Exception as e:
@@ -75,71 +133,199 @@ class ExportManager(QObject):
     def export_analytics(self, analytics: Dict, session_name: str = None) -> bool:
         """Export analytics to CSV file"""
         try:
+            now = datetime.now()
             if not session_name:
-                session_name = f"analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                session_name = f"analytics_{now.strftime('%Y%m%d_%H%M%S')}"
 
-            filename = self.export_dir / f"{session_name}_analytics.csv"
+            filename = self._dir_str + session_name + "_analytics.csv"
 
+            # Build the CSV in memory, then write it in one call
             with open(filename, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-
-                # Write header
-                writer.writerow(["Metric", "Value", "Timestamp"])
-
-                # Write data
-                for metric, value in analytics.items():
-                    if isinstance(value, dict):
-                        for sub_metric, sub_value in value.items():
-                            writer.writerow(
-                                [
-                                    f"{metric}_{sub_metric}",
-                                    sub_value,
-                                    datetime.now().isoformat(),
-                                ]
-                            )
-                    else:
-                        writer.writerow([metric, value, datetime.now().isoformat()])
-
-            self.export_completed.emit(str(filename), "csv")
+                f.write(self._format_analytics(analytics, now))
+
+            self.export_completed.emit(filename, "csv")
             return True
 
         except Exception as e:
             self.export_failed.emit(f"Failed to export analytics: {str(e)}")
             return False
 
-    def export_session_report(self, session_data: Dict) -> bool:
-        """Export complete session report"""
+    def export_session_report(
+        self, session_data: Dict, output_format: str = "json"
+    ) -> bool:
+        """Export complete session report as JSON or, optionally, msgpack"""
         try:
+            if output_format == "msgpack" and not MSGPACK_AVAILABLE:
+                self.export_failed.emit(
+                    "msgpack export requires msgpack. Install with: pip install msgpack"
+                )
+                return False
+
+            now = datetime.now()
             session_name = session_data.get(
-                "session_name", f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                "session_name", f"session_{now.strftime('%Y%m%d_%H%M%S')}"
             )
 
             # Create comprehensive report
-            report = {
-                "session_info": {
-                    "name": session_name,
-                    "date": datetime.now().isoformat(),
-                    "duration": session_data.get("duration", "N/A"),
-                    "status": session_data.get("status", "completed"),
-                },
-                "transcript": session_data.get("transcript", ""),
-                "feedback": session_data.get("feedback", {}),
-                "analytics": session_data.get("analytics", {}),
-                "metadata": session_data.get("metadata", {}),
-            }
-
-            filename = self.export_dir / f"{session_name}_complete_report.json"
+            report = self._session_report(session_data, session_name, now)
+
+            if output_format == "msgpack":
+                filename = self._dir_str + session_name + "_complete_report.msgpack"
+                self._write_bytes(filename, msgpack.packb(report, use_bin_type=True))
+                self.export_completed.emit(filename, "msgpack")
+                return True
+
+            suffix, payload = self._encode_report(report)
+            filename = self._dir_str + session_name + "_complete_report" + suffix
+            self._write_bytes(filename, payload)
+
+            if suffix.endswith(".gz"):
+                self.export_completed.emit(filename, "json.gz")
+            else:
+                self.export_completed.emit(filename, "report")
+            return True
 
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.export_failed.emit(f"Failed to export session report: {str(e)}")
+            return False
 
-            self.export_completed.emit(str(filename), "report")
+    def export_bundle(self, session_data: Dict) -> bool:
+        """Export transcript, feedback, analytics and report for one session"""
+        try:
+            now = datetime.now()
+            session_name = session_data.get(
+                "session_name", f"session_{now.strftime('%Y%m%d_%H%M%S')}"
+            )
+            prefix = self._dir_str + session_name
+
+            # Encode every payload up front so the writes run back to back
+            payloads = []
+            transcript = session_data.get("transcript")
+            if transcript:
+                payloads.append(
+                    (
+                        prefix + "_transcript.txt",
+                        self._format_transcript(transcript, session_name, now),
+                    )
+                )
+            feedback = session_data.get("feedback")
+            if feedback:
+                payloads.append(
+                    (
+                        prefix + "_feedback.json",
+                        _dump_json(self._feedback_data(feedback, session_name, now)),
+                    )
+                )
+            analytics = session_data.get("analytics")
+            if analytics:
+                payloads.append(
+                    (
+                        prefix + "_analytics.csv",
+                        self._format_analytics(analytics, now).encode("utf-8"),
+                    )
+                )
+            suffix, payload = self._encode_report(
+                self._session_report(session_data, session_name, now)
+            )
+            payloads.append((prefix + "_complete_report" + suffix, payload))
+
+            for filename, payload in payloads:
+                if isinstance(payload, str):
+                    self._write_transcript(filename, payload)
+                else:
+                    self._write_bytes(filename, payload)
+
+            self.export_completed.emit(str(self.export_dir), "bundle")
             return True
 
         except Exception as e:
-            self.export_failed.emit(f"Failed to export session report: {str(e)}")
+            self.export_failed.emit(f"Failed to export session bundle: {str(e)}")
             return False
 
+    @staticmethod
+    def _encode_report(report: Dict):
+        """Encode a session report, returning (file suffix, payload bytes)
+
+        Reports are written as indented JSON so they remain easy to read;
+        those over _GZIP_THRESHOLD are re-encoded compactly and gzipped.
+        """
+        payload = _dump_json(report)
+        if len(payload) <= _GZIP_THRESHOLD:
+            return ".json", payload
+        return ".json.gz", gzip.compress(
+            _dump_json(report, indent=False), compresslevel=1
+        )
+
+    @staticmethod
+    def _format_transcript(transcript: str, session_name: str, now: datetime) -> str:
+        """Prefix a transcript with the SoapBoxx export header"""
+        header = "\n".join(
+            [
+                "SOAPBOXX TRANSCRIPT",
+                f"Session: {session_name}",
+                f"Date: {now.strftime('%Y-%m-%d %H:%M:%S')}",
+                "=" * 50,
+                "",
+                "",
+            ]
+        )
+        return header + transcript
+
+    @staticmethod
+    def _write_transcript(filename: str, text: str):
+        """Write transcript text, header and body in a single write"""
+        if os.name == "posix":
+            _write_file_bytes(filename, text.encode("utf-8"))
+        else:
+            # Text mode keeps the platform's newline translation on Windows
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    @staticmethod
+    def _write_bytes(filename: str, payload: bytes):
+        """Write an already encoded export payload"""
+        with open(filename, "wb") as f:
+            f.write(payload)
+
+    @staticmethod
+    def _feedback_data(feedback: Dict, session_name: str, now: datetime) -> Dict:
+        """Wrap feedback with session details for export"""
+        return {
+            "session_name": session_name,
+            "export_date": now.isoformat(),
+            "feedback": feedback,
+        }
+
+    @staticmethod
+    def _format_analytics(analytics: Dict, now: datetime) -> str:
+        """Render analytics as CSV text"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # Write header
+        writer.writerow(["Metric", "Value", "Timestamp"])
+
+        # Write data, flattening nested metric groups to any depth
+        writer.writerows(_flatten(analytics, now.isoformat()))
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _session_report(session_data: Dict, session_name: str, now: datetime) -> Dict:
+        """Build the complete session report"""
+        return {
+            "session_info": {
+                "name": session_name,
+                "date": now.isoformat(),
+                "duration": session_data.get("duration", "N/A"),
+                "status": session_data.get("status", "completed"),
+            },
+            "transcript": session_data.get("transcript", ""),
+            "feedback": session_data.get("feedback", {}),
+            "analytics": session_data.get("analytics", {}),
+            "metadata": session_data.get("metadata", {}),
+        }
+
     def get_export_directory(self) -> str:
         """Get the export directory path"""
         return str(self.export_dir)
@@ -4,10 +4,69 @@ Keyboard Shortcuts Manager for SoapBoxx
 Handles hotkeys for common actions
 """
 
+from functools import lru_cache, partial
+
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import QMainWindow, QWidget
 
+# (action name, key sequence, description) for every default shortcut
+_SHORTCUT_DEFS = (
+    # Recording shortcuts
+    ("start_recording", "Ctrl+R", "Start/Stop Recording"),
+    ("pause_recording", "Ctrl+P", "Pause/Resume Recording"),
+    # Navigation shortcuts
+    ("next_tab", "Ctrl+Tab", "Next Tab"),
+    ("previous_tab", "Ctrl+Shift+Tab", "Previous Tab"),
+    ("soapboxx_tab", "Ctrl+1", "SoapBoxx Tab"),
+    ("reverb_tab", "Ctrl+2", "Reverb Tab"),
+    ("scoop_tab", "Ctrl+3", "Scoop Tab"),
+    # Export shortcuts
+    ("export_transcript", "Ctrl+E", "Export Transcript"),
+    ("export_feedback", "Ctrl+Shift+E", "Export Feedback"),
+    ("export_all", "Ctrl+Alt+E", "Export All"),
+    # Analysis shortcuts
+    ("content_analysis", "Ctrl+A", "Content Analysis"),
+    ("performance_coaching", "Ctrl+C", "Performance Coaching"),
+    ("guest_research", "Ctrl+G", "Guest Research"),
+    # Utility shortcuts
+    ("clear_results", "Ctrl+L", "Clear Results"),
+    ("save_session", "Ctrl+S", "Save Session"),
+    ("open_export_folder", "Ctrl+O", "Open Export Folder"),
+    # Help shortcuts
+    ("show_help", "F1", "Show Help"),
+    ("show_shortcuts", "Ctrl+?", "Show Shortcuts"),
+)
+
+
+@lru_cache(maxsize=None)
+def _key_sequence(key_sequence: str) -> QKeySequence:
+    """Parse a key sequence string once and reuse it across windows"""
+    return QKeySequence(key_sequence)
+
+
+# Shortcut action -> (main window method name, positional arguments).
+# Methods are looked up when the shortcut fires, not when it is registered.
+_MAIN_WINDOW_ACTIONS = {
+    "start_recording": ("start_recording", ()),
+    "pause_recording": ("pause_recording", ()),
+    "next_tab": ("next_tab", ()),
+    "previous_tab": ("previous_tab", ()),
+    "soapboxx_tab": ("switch_to_tab", (0,)),
+    "reverb_tab": ("switch_to_tab", (1,)),
+    "scoop_tab": ("switch_to_tab", (2,)),
+    "export_transcript": ("export_transcript", ()),
+    "export_feedback": ("export_feedback", ()),
+    "export_all": ("export_all", ()),
+    "content_analysis": ("content_analysis", ()),
+    "performance_coaching": ("performance_coaching", ()),
+    "guest_research": ("guest_research", ()),
+    "clear_results": ("clear_results", ()),
+    "save_session": ("save_session", ()),
+    "open_export_folder": ("open_export_folder", ()),
+    "show_help": ("show_help", ()),
+}
+
 
 class KeyboardShortcuts(QObject):
     """Manages keyboard shortcuts for SoapBoxx"""
@@ -18,6 +77,8 @@ class KeyboardShortcuts(QObject):
         super().__init__(parent)
         self.shortcuts = {}
         self.parent = parent
+        self._help_text = None
+        self._help_msg = None
         self.setup_shortcuts()
 
     def setup_shortcuts(self):
@@ -25,35 +86,8 @@ class KeyboardShortcuts(QObject):
         if not self.parent:
             return
 
-        # Recording shortcuts
-        self.add_shortcut("start_recording", "Ctrl+R", "Start/Stop Recording")
-        self.add_shortcut("pause_recording", "Ctrl+P", "Pause/Resume Recording")
-
-        # Navigation shortcuts
-        self.add_shortcut("next_tab", "Ctrl+Tab", "Next Tab")
-        self.add_shortcut("previous_tab", "Ctrl+Shift+Tab", "Previous Tab")
-        self.add_shortcut("soapboxx_tab", "Ctrl+1", "SoapBoxx Tab")
-        self.add_shortcut("reverb_tab", "Ctrl+2", "Reverb Tab")
-        self.add_shortcut("scoop_tab", "Ctrl+3", "Scoop Tab")
-
-        # Export shortcuts
-        self.add_shortcut("export_transcript", "Ctrl+E", "Export Transcript")
-        self.add_shortcut("export_feedback", "Ctrl+Shift+E", "Export Feedback")
-        self.add_shortcut("export_all", "Ctrl+Alt+E", "Export All")
-
-        # Analysis shortcuts
-        self.add_shortcut("content_analysis", "Ctrl+A", "Content Analysis")
-        self.add_shortcut("performance_coaching", "Ctrl+C", "Performance Coaching")
-        self.add_shortcut("guest_research", "Ctrl+G", "Guest Research")
-
-        # Utility shortcuts
-        self.add_shortcut("clear_results", "Ctrl+L", "Clear Results")
-        self.add_shortcut("save_session", "Ctrl+S", "Save Session")
-        self.add_shortcut("open_export_folder", "Ctrl+O", "Open Export Folder")
-
-        # Help shortcuts
-        self.add_shortcut("show_help", "F1", "Show Help")
-        self.add_shortcut("show_shortcuts", "Ctrl+?", "Show Shortcuts")
+        for action_name, key_sequence, description in _SHORTCUT_DEFS:
+            self.add_shortcut(action_name, key_sequence, description)
 
     def add_shortcut(self, action_name: str, key_sequence: str, description: str):
         """Add a keyboard shortcut"""
@@ -61,15 +95,16 @@ class KeyboardShortcuts(QObject):
             return
 
         try:
-            shortcut = QShortcut(QKeySequence(key_sequence), self.parent)
+            shortcut = QShortcut(_key_sequence(key_sequence), self.parent)
             shortcut.activated.connect(
-                lambda: self.shortcut_triggered.emit(action_name)
+                partial(self.shortcut_triggered.emit, action_name)
             )
             self.shortcuts[action_name] = {
                 "shortcut": shortcut,
                 "key_sequence": key_sequence,
                 "description": description,
             }
+            self._help_text = None
         except Exception as e:
             print(f"Failed to add shortcut {action_name}: {e}")
 
@@ -88,9 +123,27 @@ class KeyboardShortcuts(QObject):
 
     def show_shortcuts_help(self):
         """Show shortcuts help dialog"""
-        shortcuts_list = self.get_shortcuts_list()
+        # Rebuild the text only when the registered shortcuts have changed
+        if self._help_text is None:
+            self._help_text = self._build_help_text()
+            if self._help_msg is not None:
+                self._help_msg.setText(self._help_text)
 
-        help_text = "🎯 SoapBoxx Keyboard Shortcuts\n\n"
+        if self._help_msg is None:
+            from PyQt6.QtWidgets import QMessageBox
+
+            self._help_msg = QMessageBox()
+            self._help_msg.setWindowTitle("Keyboard Shortcuts")
+            self._help_msg.setText(self._help_text)
+            self._help_msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        self._help_msg.exec()
+
+    def _build_help_text(self) -> str:
+        """Format the registered shortcuts by category"""
+        shortcuts_by_action = {s["action"]: s for s in self.get_shortcuts_list()}
+
+        parts = ["🎯 SoapBoxx Keyboard Shortcuts\n\n"]
 
         # Group shortcuts by category
         categories = {
@@ -109,25 +162,19 @@ class KeyboardShortcuts(QObject):
         }
 
         for category, actions in categories.items():
-            help_text += f"📁 {category}\n"
-            help_text += "─" * (len(category) + 4) + "\n"
+            parts.append(f"📁 {category}\n")
+            parts.append("─" * (len(category) + 4) + "\n")
 
             for action in actions:
-                for shortcut_info in shortcuts_list:
-                    if shortcut_info["action"] == action:
-                        help_text += f"  {shortcut_info['key']:<15} {shortcut_info['description']}\n"
-                        break
+                shortcut_info = shortcuts_by_action.get(action)
+                if shortcut_info:
+                    parts.append(
+                        f"  {shortcut_info['key']:<15} {shortcut_info['description']}\n"
+                    )
 
-            help_text += "\n"
+            parts.append("\n")
 
-        # Show help dialog
-        from PyQt6.QtWidgets import QMessageBox
-
-        msg = QMessageBox()
-        msg.setWindowTitle("Keyboard Shortcuts")
-        msg.setText(help_text)
-        msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg.exec()
+        return "".join(parts)
 
 
 class ShortcutHandler:
@@ -141,44 +188,17 @@ class ShortcutHandler:
     def handle_shortcut(self, action_name: str):
         """Handle shortcut actions"""
         try:
-            if action_name == "start_recording":
-                self.main_window.start_recording()
-            elif action_name == "pause_recording":
-                self.main_window.pause_recording()
-            elif action_name == "next_tab":
-                self.main_window.next_tab()
-            elif action_name == "previous_tab":
-                self.main_window.previous_tab()
-            elif action_name == "soapboxx_tab":
-                self.main_window.switch_to_tab(0)
-            elif action_name == "reverb_tab":
-                self.main_window.switch_to_tab(1)
-            elif action_name == "scoop_tab":
-                self.main_window.switch_to_tab(2)
-            elif action_name == "export_transcript":
-                self.main_window.export_transcript()
-            elif action_name == "export_feedback":
-                self.main_window.export_feedback()
-            elif action_name == "export_all":
-                self.main_window.export_all()
-            elif action_name == "content_analysis":
-                self.main_window.content_analysis()
-            elif action_name == "performance_coaching":
-                self.main_window.performance_coaching()
-            elif action_name == "guest_research":
-                self.main_window.guest_research()
-            elif action_name == "clear_results":
-                self.main_window.clear_results()
-            elif action_name == "save_session":
-                self.main_window.save_session()
-            elif action_name == "open_export_folder":
-                self.main_window.open_export_folder()
-            elif action_name == "show_help":
-                self.main_window.show_help()
-            elif action_name == "show_shortcuts":
+            if action_name == "show_shortcuts":
                 self.shortcuts.show_shortcuts_help()
-            else:
+                return
+
+            target = _MAIN_WINDOW_ACTIONS.get(action_name)
+            if target is None:
                 print(f"Unknown shortcut action: {action_name}")
+                return
+
+            method_name, args = target
+            getattr(self.main_window, method_name)(*args)
 
         except Exception as e:
             print(f"Error handling shortcut {action_name}: {e}")
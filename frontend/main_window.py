@@ -17,43 +17,29 @@ if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
 # Use package-relative imports to support `python -m frontend.main_window`
+# Reverb and Scoop tabs are imported when first opened (see _create_*_tab)
 try:
-    from .batch_processor import BatchProcessorDialog
     from .export_manager import ExportManager
     from .keyboard_shortcuts import ShortcutHandler
-    from .reverb_tab import ReverbTab
-    from .scoop_tab import ScoopTab
     from .soapboxx_tab import SoapBoxxTab
     from .theme_manager import ThemeManager
 except ImportError:
     # Fallback for direct script execution
     try:
-        from batch_processor import BatchProcessorDialog
         from export_manager import ExportManager
         from keyboard_shortcuts import ShortcutHandler
-        from reverb_tab import ReverbTab
-        from scoop_tab import ScoopTab
         from soapboxx_tab import SoapBoxxTab
         from theme_manager import ThemeManager
     except ImportError as e:
         print(f"Warning: Some frontend modules not available: {e}")
 
         # Create placeholder classes for missing modules
-        class BatchProcessorDialog:
-            pass
-
         class ExportManager:
             pass
 
         class ShortcutHandler:
             pass
 
-        class ReverbTab:
-            pass
-
-        class ScoopTab:
-            pass
-
         class SoapBoxxTab:
             pass
 
@@ -74,26 +60,121 @@ from PyQt6.QtWidgets import (QApplication, QComboBox, QDateEdit, QDialog,
 # (imports moved into try/except above for dual compatibility)
 
 
+# Application-wide stylesheet, applied once to the QApplication. Widgets are
+# matched by object name or by their "styleType" property so that same-named
+# widget classes defined by the tabs keep their own styling.
+_APP_STYLE = """
+    QMainWindow {
+        background-color: #F8F9FA;
+    }
+    QTabWidget::pane {
+        border: 1px solid #E0E0E0;
+        border-radius: 8px;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #F1F3F4;
+        border: 1px solid #E0E0E0;
+        border-bottom: none;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        padding: 12px 24px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: white;
+        border-bottom: 2px solid #3498DB;
+    }
+    QTabBar::tab:hover {
+        background-color: #E8EAED;
+    }
+    QStatusBar {
+        background-color: #F8F9FA;
+        border-top: 1px solid #E0E0E0;
+    }
+
+    ModernCard[styleType="card"] {
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 12px;
+        padding: 16px;
+        margin: 8px;
+    }
+    ModernCard[styleType="card"]:hover {
+        border: 1px solid #BDBDBD;
+    }
+
+    ModernButton[styleType="primary"], ModernButton[styleType="secondary"] {
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 24px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    ModernButton[styleType="primary"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #3498DB, stop:1 #2980B9);
+    }
+    ModernButton[styleType="primary"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #5DADE2, stop:1 #3498DB);
+    }
+    ModernButton[styleType="primary"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2980B9, stop:1 #21618C);
+    }
+    ModernButton[styleType="secondary"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #95A5A6, stop:1 #7F8C8D);
+    }
+    ModernButton[styleType="secondary"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #BDC3C7, stop:1 #95A5A6);
+    }
+    ModernButton[styleType="secondary"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #7F8C8D, stop:1 #6C7B7D);
+    }
+    ModernButton[styleType="primary"]:disabled,
+    ModernButton[styleType="secondary"]:disabled {
+        background: #BDC3C7;
+        color: #7F8C8D;
+    }
+
+    QLabel#HeaderTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2C3E50;
+    }
+    QLabel#HeaderSubtitle {
+        font-size: 14px;
+        color: #7F8C8D;
+    }
+    QLabel#TabLoadingMessage {
+        color: #3498DB;
+        font-size: 16px;
+        padding: 40px;
+    }
+    QLabel#TabErrorMessage {
+        color: #E74C3C;
+        font-size: 14px;
+        padding: 20px;
+    }
+    QLabel#ErrorIndicator {
+        color: #E74C3C;
+        font-weight: bold;
+    }
+"""
+
+
 class ModernCard(QFrame):
     """Modern card widget with shadow and rounded corners"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet(
-            """
-            ModernCard {
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 12px;
-                padding: 16px;
-                margin: 8px;
-            }
-            ModernCard:hover {
-                border: 1px solid #BDBDBD;
-            }
-        """
-        )
+        self.setProperty("styleType", "card")
 
 
 class ModernButton(QPushButton):
@@ -102,63 +183,19 @@ class ModernButton(QPushButton):
     def __init__(self, text="", parent=None, style="primary"):
         super().__init__(text, parent)
         self.style_type = style
-        self.update_style()
+        # Styling comes from the application stylesheet, matched on this
+        # property when Qt first polishes the button
+        self.setProperty("styleType", style)
 
     def update_style(self):
-        if self.style_type == "primary":
-            self.setStyleSheet(
-                """
-                ModernButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #3498DB, stop:1 #2980B9);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                ModernButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #5DADE2, stop:1 #3498DB);
-                }
-                ModernButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2980B9, stop:1 #21618C);
-                }
-                ModernButton:disabled {
-                    background: #BDC3C7;
-                    color: #7F8C8D;
-                }
-            """
-            )
-        elif self.style_type == "secondary":
-            self.setStyleSheet(
-                """
-                ModernButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #95A5A6, stop:1 #7F8C8D);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                ModernButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #BDC3C7, stop:1 #95A5A6);
-                }
-                ModernButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #7F8C8D, stop:1 #6C7B7D);
-                }
-                ModernButton:disabled {
-                    background: #BDC3C7;
-                    color: #7F8C8D;
-                }
-            """
-            )
+        if self.property("styleType") == self.style_type:
+            return
+
+        self.setProperty("styleType", self.style_type)
+        # An already polished button must be re-polished to pick up the change
+        if self.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            self.style().unpolish(self)
+            self.style().polish(self)
 
 
 class BookingDialog(QDialog):
@@ -346,39 +383,8 @@ class MainWindow(QMainWindow):
     def _apply_modern_theme(self):
         """Apply modern theme to the application"""
         try:
-            # Modern application style
-            self.setStyleSheet(
-                """
-                QMainWindow {
-                    background-color: #F8F9FA;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #E0E0E0;
-                    border-radius: 8px;
-                    background-color: white;
-                }
-                QTabBar::tab {
-                    background-color: #F1F3F4;
-                    border: 1px solid #E0E0E0;
-                    border-bottom: none;
-                    border-top-left-radius: 8px;
-                    border-top-right-radius: 8px;
-                    padding: 12px 24px;
-                    margin-right: 2px;
-                }
-                QTabBar::tab:selected {
-                    background-color: white;
-                    border-bottom: 2px solid #3498DB;
-                }
-                QTabBar::tab:hover {
-                    background-color: #E8EAED;
-                }
-                QStatusBar {
-                    background-color: #F8F9FA;
-                    border-top: 1px solid #E0E0E0;
-                }
-            """
-            )
+            # One stylesheet for the whole application
+            QApplication.instance().setStyleSheet(_APP_STYLE)
         except Exception as e:
             print(f"Failed to apply theme: {e}")
 
@@ -390,26 +396,11 @@ class MainWindow(QMainWindow):
 
             # Title
             title_label = QLabel("SoapBoxx")
-            title_label.setStyleSheet(
-                """
-                QLabel {
-                    font-size: 24px;
-                font-weight: bold;
-                    color: #2C3E50;
-                }
-            """
-            )
+            title_label.setObjectName("HeaderTitle")
 
             # Subtitle
             subtitle_label = QLabel("AI-Powered Podcast Production Studio")
-            subtitle_label.setStyleSheet(
-                """
-                QLabel {
-                    font-size: 14px;
-                    color: #7F8C8D;
-                }
-            """
-            )
+            subtitle_label.setObjectName("HeaderSubtitle")
 
             # Title layout
             title_layout = QVBoxLayout()
@@ -551,15 +542,7 @@ class MainWindow(QMainWindow):
             # Loading message
             loading_label = QLabel(message)
             loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #3498DB;
-                    font-size: 16px;
-                    padding: 40px;
-                }
-            """
-            )
+            loading_label.setObjectName("TabLoadingMessage")
 
             layout.addWidget(loading_label)
             layout.addStretch()
@@ -594,6 +577,11 @@ class MainWindow(QMainWindow):
     def _create_scoop_tab(self):
         """Create Scoop tab with error handling"""
         try:
+            try:
+                from .scoop_tab import ScoopTab
+            except ImportError:
+                from scoop_tab import ScoopTab
+
             return ScoopTab()
         except Exception as e:
             self._track_error("ScoopTabError", f"Failed to create Scoop tab: {str(e)}")
@@ -602,6 +590,11 @@ class MainWindow(QMainWindow):
     def _create_reverb_tab(self):
         """Create Reverb tab with error handling"""
         try:
+            try:
+                from .reverb_tab import ReverbTab
+            except ImportError:
+                from reverb_tab import ReverbTab
+
             return ReverbTab()
         except Exception as e:
             self._track_error(
@@ -618,15 +611,7 @@ class MainWindow(QMainWindow):
             # Error message
             error_label = QLabel(message)
             error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            error_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #E74C3C;
-                    font-size: 14px;
-                    padding: 20px;
-                }
-            """
-            )
+            error_label.setObjectName("TabErrorMessage")
 
             # Retry button
             retry_button = ModernButton("Retry Loading", style="primary")
@@ -688,14 +673,7 @@ class MainWindow(QMainWindow):
 
             # Error count indicator
             self.error_indicator = QLabel("")
-            self.error_indicator.setStyleSheet(
-                """
-                QLabel {
-                    color: #E74C3C;
-                    font-weight: bold;
-                }
-            """
-            )
+            self.error_indicator.setObjectName("ErrorIndicator")
             self.status_bar.addPermanentWidget(self.error_indicator)
 
             # Update status